@@ -1,12 +1,25 @@
 import streamlit as st
 import sqlite3
+import logging
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from pathlib import Path
 import time
+import math
+
+# DuckDB is optional; without it the analytics queries run on SQLite
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+logger = logging.getLogger(__name__)
 
 # Constants
+DB_PATH = Path("data/project_tracker.db")
+
 RESOURCE_TYPE_MAP = {
     1: 'Internal',
     2: 'External',
@@ -15,6 +28,89 @@ RESOURCE_TYPE_MAP = {
 
 PHASE_ORDER = ['Planning', 'In Progress', 'On Hold', 'Completed']
 
+# Business impact is scored 1-4, so risk * 5 + impact is a unique small-integer key
+IMPACT_KEY_BASE = 5
+
+PHASE_HELP = {
+    'Planning': 'Percentage of projects in planning phase',
+    'In Progress': 'Percentage of projects in progress',
+    'On Hold': 'Percentage of projects on hold',
+    'Completed': 'Percentage of completed projects'
+}
+
+# Static pipeline chart styling, built once instead of on every rerun
+PIPELINE_MARKER = dict(
+    color=['#2ecc71', '#3498db', '#f1c40f', '#9b59b6'],  # Different color for each phase
+    line=dict(color='rgba(0,0,0,0)', width=1)
+)
+
+PIPELINE_LAYOUT = dict(
+    title=dict(
+        text="Project Pipeline Status",
+        x=0.5,
+        y=0.95,
+        xanchor='center',
+        yanchor='top',
+        font=dict(size=20)
+    ),
+    xaxis=dict(
+        title="Number of Projects",
+        showgrid=True,
+        gridcolor='rgba(211,211,211,0.3)',
+        zeroline=False
+    ),
+    yaxis=dict(
+        title="",
+        showgrid=False,
+        zeroline=False
+    ),
+    plot_bgcolor='white',
+    showlegend=False,
+    height=400,
+    margin=dict(l=20, r=20, t=60, b=20),
+    bargap=0.3
+)
+
+PIPELINE_ANNOTATION_STYLE = dict(
+    showarrow=False,
+    xanchor='left',
+    xshift=10,
+    font=dict(size=12)
+)
+
+# Columns shown in the project details table
+DISPLAY_COLS = [
+    'project_name', 'category', 'priority_level', 'project_phase',
+    'business_impact', 'risk_level', 'notes'
+]
+
+# Project details table limits; long notes are truncated server-side and rows
+# are paged in SQL so the payload scales with rows shown, not rows stored
+NOTES_PREVIEW_CHARS = 280
+# Cut notes end with an ellipsis so they can be told apart from complete ones
+NOTES_PREVIEW_SQL = (
+    f"CASE WHEN length(notes) > {NOTES_PREVIEW_CHARS} "
+    f"THEN substr(notes, 1, {NOTES_PREVIEW_CHARS}) || '…' ELSE notes END AS notes"
+)
+PROJECTS_PAGE_SIZE = 50
+
+# Chart size limits (SVG charts slow down badly past a few hundred marks)
+TREEMAP_MAX_CATEGORIES = 20
+TREEMAP_MAX_ROWS = 500
+SCATTER_MAX_MARKER_SIZE = 20
+
+# Cache bounds: one entry per data version, more for project queries keyed on filters and page
+CACHE_MAX_VERSIONS = 8
+CACHE_MAX_QUERIES = 128
+
+# Filter indexes plus a covering index for the summary GROUP BY, which also serves the phase filter
+INDEX_STATEMENTS = [
+    "CREATE INDEX IF NOT EXISTS idx_idea_cat ON idea_store(category)",
+    "CREATE INDEX IF NOT EXISTS idx_idea_prio ON idea_store(priority_level)",
+    "CREATE INDEX IF NOT EXISTS idx_idea_agg ON idea_store("
+    "project_phase, risk_level, business_impact, resource_type, priority_level)"
+]
+
 # Set page config
 st.set_page_config(
     page_title="Project Portfolio Dashboard",
@@ -22,176 +118,356 @@ st.set_page_config(
     layout="wide"
 )
 
-# Database connection with shorter cache
-@st.cache_resource(ttl=60)  # Cache expires after 60 seconds
+# Best-effort WAL and index setup through a short-lived writable handle
+def prepare_database(db_path):
+    try:
+        rw_conn = sqlite3.connect(db_path, timeout=1)
+        try:
+            rw_conn.execute("PRAGMA journal_mode=WAL")
+            schema_version = rw_conn.execute("PRAGMA schema_version").fetchone()[0]
+            for statement in INDEX_STATEMENTS:
+                rw_conn.execute(statement)
+            # Re-analyze after creating an index or when the row count drifted far from the stats
+            index_created = rw_conn.execute("PRAGMA schema_version").fetchone()[0] != schema_version
+            stat_table = rw_conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='sqlite_stat1'"
+            ).fetchone()
+            stat_rows = None
+            if stat_table is not None:
+                stat = rw_conn.execute(
+                    "SELECT stat FROM sqlite_stat1 WHERE tbl='idea_store' LIMIT 1"
+                ).fetchone()
+                if stat is not None:
+                    stat_rows = int(stat[0].split()[0])
+            row_count = rw_conn.execute("SELECT COUNT(*) FROM idea_store").fetchone()[0]
+            stale = stat_rows is None or not (stat_rows / 2 <= row_count <= stat_rows * 2)
+            if index_created or stale:
+                rw_conn.execute("ANALYZE idea_store")
+            rw_conn.execute("PRAGMA optimize")
+        finally:
+            rw_conn.close()
+    except sqlite3.Error:
+        pass
+
+# Read-only database connection reused across reruns; failures raise so they are not cached
+@st.cache_resource
 def get_db_connection():
+    db_path = DB_PATH
+    prepare_database(db_path)
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False)
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped reads
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    conn.execute("PRAGMA busy_timeout=5000")
+    return conn
+
+# Run a read query and return the result as a DataFrame
+def run_query(query, params=()):
     try:
-        db_path = Path("data/project_tracker.db")
-        conn = sqlite3.connect(db_path)
-        return conn
+        conn = get_db_connection()
+        return pd.read_sql_query(query, conn, params=params, dtype_backend="pyarrow")
     except Exception as e:
-        st.error(f"Failed to connect to database: {str(e)}")
+        st.error(f"Failed to load data: {str(e)}")
+    return pd.DataFrame()
+
+# DuckDB attached to the SQLite file, used for the dashboard analytics so the
+# aggregations run vectorized; setup failures raise so they are not cached
+@st.cache_resource
+def get_analytics_connection():
+    if duckdb is None:
         return None
+    con = duckdb.connect()
+    con.execute("INSTALL sqlite")
+    con.execute("LOAD sqlite")
+    con.execute(f"ATTACH '{DB_PATH}' AS tracker (TYPE SQLITE, READ_ONLY)")
+    return con
 
-# Load data with shorter cache
-@st.cache_data(ttl=60)  # Cache expires after 60 seconds
-def load_data():
-    conn = get_db_connection()
-    if conn is not None:
-        try:
-            df = pd.read_sql_query("SELECT * FROM idea_store", conn)
-            df['resource_type_label'] = df['resource_type'].map(RESOURCE_TYPE_MAP)
-            return df
-        except Exception as e:
-            st.error(f"Failed to load data: {str(e)}")
-            return pd.DataFrame()
-    return pd.DataFrame()
+# Run an analytics query on DuckDB, falling back to SQLite
+def run_analytics_query(query, params=()):
+    try:
+        con = get_analytics_connection()
+    except Exception:
+        logger.warning("DuckDB unavailable, using SQLite for analytics", exc_info=True)
+        return run_query(query, params)
+    if con is None:
+        return run_query(query, params)
+    try:
+        # Each rerun thread gets its own cursor; the attached database is shared
+        with con.cursor() as cur:
+            cur.execute("USE tracker")
+            return cur.execute(query, list(params)).df().convert_dtypes(dtype_backend="pyarrow")
+    except Exception:
+        # The SQL is engine-neutral, so queries DuckDB rejects are retried on SQLite
+        logger.warning("DuckDB query failed, retrying on SQLite", exc_info=True)
+        return run_query(query, params)
 
-def render_dashboard_tab(df):
-    # Top level metrics
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Total Projects", len(df))
-    with col2:
-        st.metric("High Priority Projects", len(df[df['priority_level'] >= 3]))
-    with col3:
-        st.metric("Active Projects", len(df[df['project_phase'] == 'In Progress']))
-    with col4:
-        st.metric("Categories", df['category'].nunique())
-
-    # Two columns layout
-    left_col, right_col = st.columns([2, 1])
-
-    with left_col:
-        # Project Distribution by Category and Priority
-        st.subheader("Project Distribution")
-        if not df.empty:
-            fig = px.treemap(
-                df,
-                path=['category', 'project_name'],
-                values='priority_level',
-                color='priority_level',
-                color_continuous_scale='viridis',
-                title='Projects by Category and Priority'
-            )
-            st.plotly_chart(fig, use_container_width=True)
-
-        # Project Phase Pipeline - Updated version
-        st.subheader("Project Pipeline")
-        phase_counts = df['project_phase'].value_counts().reindex(PHASE_ORDER).fillna(0)
-        
-        # Create a more appealing Sankey-like pipeline
-        fig = go.Figure()
-        
-        # Add the main bars
-        fig.add_trace(go.Bar(
-            x=phase_counts.values,
-            y=PHASE_ORDER,
-            orientation='h',
-            text=phase_counts.values,
-            textposition='auto',
+# Cheap table fingerprint (max rowid, row count, data_version) that keys the cached loaders
+def get_data_version():
+    try:
+        conn = get_db_connection()
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        return conn.execute("SELECT MAX(rowid), COUNT(*) FROM idea_store").fetchone() + (data_version,)
+    except Exception as e:
+        st.error(f"Failed to load data: {str(e)}")
+    return None
+
+# All dashboard aggregations come from one pass over the table: the database
+# builds a small phase x risk x impact x resource cube and every metric is rolled up from it
+@st.cache_data(max_entries=CACHE_MAX_VERSIONS)
+def load_summary(version):
+    cube = run_analytics_query("""
+        SELECT project_phase, risk_level, business_impact, resource_type,
+               COUNT(*) AS count,
+               CAST(SUM(CASE WHEN priority_level >= 3 THEN 1 ELSE 0 END) AS INTEGER) AS high_priority
+        FROM idea_store
+        GROUP BY project_phase, risk_level, business_impact, resource_type
+    """)
+    if cube.empty:
+        return None
+
+    # Risk, impact and resource type are small integers, so their rollups are
+    # weighted np.bincount calls over one combined key instead of hash groupbys
+    rated = cube.dropna(subset=['risk_level', 'business_impact'])
+    integral = (rated['risk_level'].round() == rated['risk_level']) & (rated['business_impact'].round() == rated['business_impact'])
+    keyed = rated[integral]
+    risk_impact_key = keyed['risk_level'].to_numpy('int64') * IMPACT_KEY_BASE + keyed['business_impact'].to_numpy('int64')
+    risk_impact_counts = np.bincount(risk_impact_key, weights=keyed['count'].to_numpy('int64'))
+    keys = np.flatnonzero(risk_impact_counts)
+    risk_impact = pd.DataFrame({
+        'risk_level': keys // IMPACT_KEY_BASE,
+        'business_impact': keys % IMPACT_KEY_BASE,
+        'count': risk_impact_counts[keys].astype('int64')
+    })
+    # Anything else (such as a REAL 2.5 in an INTEGER column) keeps its own point, as before
+    if not integral.all():
+        others = rated[~integral].groupby(['risk_level', 'business_impact'], as_index=False)['count'].sum()
+        risk_impact = pd.concat([risk_impact, others]).sort_values(['risk_level', 'business_impact'], ignore_index=True)
+
+    # Only the mapped types have a slice, so unmapped or non-integer values are left out
+    typed = cube[cube['resource_type'].isin(list(RESOURCE_TYPE_MAP))]
+    resource_counts = np.bincount(
+        typed['resource_type'].to_numpy('int64'),
+        weights=typed['count'].to_numpy('int64'),
+        minlength=max(RESOURCE_TYPE_MAP) + 1
+    )
+
+    return {
+        'total': int(cube['count'].sum()),
+        'high_priority': int(cube['high_priority'].sum()),
+        'categories': len(load_categories(version)),
+        'phase': cube.groupby('project_phase')['count'].sum(),
+        'risk_impact': risk_impact,
+        'resource': pd.Series(
+            resource_counts[list(RESOURCE_TYPE_MAP)].astype('int64'),
+            index=pd.Index(RESOURCE_TYPE_MAP.values(), name='type'),
+            name='count'
+        ),
+    }
+
+@st.cache_data(max_entries=CACHE_MAX_VERSIONS)
+def load_treemap_data(version):
+    # Pre-aggregated leaves for the top categories, highest priority first,
+    # so only the marks that get drawn are sent to the browser; one extra row
+    # tells whether the leaves were trimmed
+    return run_analytics_query("""
+        SELECT category, project_name, CAST(SUM(priority_level) AS INTEGER) AS priority_level
+        FROM idea_store
+        WHERE category IN (
+            SELECT category FROM idea_store
+            GROUP BY category
+            ORDER BY SUM(priority_level) DESC
+            LIMIT ?
+        )
+        GROUP BY category, project_name
+        ORDER BY priority_level DESC
+        LIMIT ?
+    """, (TREEMAP_MAX_CATEGORIES, TREEMAP_MAX_ROWS + 1))
+
+@st.cache_data(max_entries=CACHE_MAX_VERSIONS)
+def load_categories(version):
+    df = run_query("SELECT DISTINCT category FROM idea_store ORDER BY category")
+    return df['category'].tolist() if not df.empty else []
+
+# WHERE clause and parameters for the project details filters
+def build_project_filters(categories, phases, min_priority):
+    where = "WHERE priority_level >= ?"
+    params = [min_priority]
+    if categories:
+        where += f" AND category IN ({', '.join('?' * len(categories))})"
+        params.extend(categories)
+    if phases:
+        where += f" AND project_phase IN ({', '.join('?' * len(phases))})"
+        params.extend(phases)
+    return where, params
+
+@st.cache_data(max_entries=CACHE_MAX_QUERIES)
+def count_projects(version, categories=(), phases=(), min_priority=1):
+    where, params = build_project_filters(categories, phases, min_priority)
+    df = run_query(f"SELECT COUNT(*) AS count FROM idea_store {where}", params)
+    return int(df['count'].iloc[0]) if not df.empty else 0
+
+# Displayed rows are only loaded for the projects table, one page at a time,
+# filtered and projected in SQL
+@st.cache_data(max_entries=CACHE_MAX_QUERIES)
+def load_projects(version, categories=(), phases=(), min_priority=1, page=1):
+    where, params = build_project_filters(categories, phases, min_priority)
+    columns = [NOTES_PREVIEW_SQL if col == 'notes' else col for col in DISPLAY_COLS]
+    query = f"SELECT {', '.join(columns)} FROM idea_store {where} ORDER BY rowid LIMIT ? OFFSET ?"
+    params.extend([PROJECTS_PAGE_SIZE, (page - 1) * PROJECTS_PAGE_SIZE])
+    return run_query(query, params)
+
+# Percentage labels for the pipeline bars, keyed on the phase counts
+@st.cache_data(max_entries=CACHE_MAX_VERSIONS)
+def build_phase_annotations(counts):
+    total_projects = sum(counts)
+    return [
+        dict(PIPELINE_ANNOTATION_STYLE, x=count, y=phase, text=f"{round(count / total_projects * 100, 1)}%")
+        for phase, count in zip(PHASE_ORDER, counts)
+        if count > 0
+    ]
+
+# The treemap is the most expensive figure to build, so its spec is cached per
+# data version; it is stored as a plain dict so it pickles into the cache
+@st.cache_data(max_entries=CACHE_MAX_VERSIONS)
+def build_treemap(version):
+    treemap_df = load_treemap_data(version).head(TREEMAP_MAX_ROWS)
+    if treemap_df.empty:
+        return None
+    return px.treemap(
+        treemap_df,
+        path=['category', 'project_name'],
+        values='priority_level',
+        color='priority_level',
+        color_continuous_scale='viridis',
+        title='Projects by Category and Priority'
+    ).to_dict()
+
+# Tell the user which category and project caps cut the treemap, if any
+def build_treemap_caption(category_count, leaf_count):
+    categories_trimmed = category_count > TREEMAP_MAX_CATEGORIES
+    rows_trimmed = leaf_count > TREEMAP_MAX_ROWS
+    categories = f"the top {TREEMAP_MAX_CATEGORIES} of {category_count} categories"
+    if categories_trimmed and rows_trimmed:
+        return f"Showing the top {TREEMAP_MAX_ROWS} projects from {categories} by priority"
+    if rows_trimmed:
+        return f"Showing the top {TREEMAP_MAX_ROWS} projects by priority"
+    if categories_trimmed:
+        return f"Showing {categories} by priority"
+    return None
+
+# Build every dashboard figure and metric value up front, without touching the UI
+def build_dashboard(summary, version):
+    # Phase counts are computed once and reused by every phase metric
+    total = summary['total']
+    phase_counts = summary['phase'].reindex(PHASE_ORDER, fill_value=0)
+    risk_impact_df = summary['risk_impact']
+    resource_counts = summary['resource']
+
+    # Create a more appealing Sankey-like pipeline; only the counts vary per rerun
+    pipeline_fig = go.Figure(go.Bar(
+        x=phase_counts.tolist(),
+        y=PHASE_ORDER,
+        orientation='h',
+        text=phase_counts.tolist(),
+        textposition='auto',
+        marker=PIPELINE_MARKER,
+        hovertemplate="Phase: %{y}<br>Projects: %{x}<extra></extra>"
+    ))
+    # Percentage annotations go in with the layout so plotly validates them once
+    pipeline_fig.update_layout(
+        PIPELINE_LAYOUT,
+        annotations=build_phase_annotations(tuple(phase_counts.tolist()))
+    )
+
+    # Risk vs Impact Matrix
+    risk_impact_fig = None
+    if not risk_impact_df.empty:
+        # WebGL trace, sized by area like px.scatter
+        counts = risk_impact_df['count']
+        risk_impact_fig = go.Figure(go.Scattergl(
+            x=risk_impact_df['risk_level'],
+            y=risk_impact_df['business_impact'],
+            mode='markers',
             marker=dict(
-                color=['#2ecc71', '#3498db', '#f1c40f', '#9b59b6'],  # Different color for each phase
-                line=dict(color='rgba(0,0,0,0)', width=1)
+                size=counts,
+                sizemode='area',
+                sizeref=2.0 * counts.max() / SCATTER_MAX_MARKER_SIZE ** 2,
+                color=counts,
+                colorbar=dict(title='count'),
+                showscale=True
             ),
-            hovertemplate="Phase: %{y}<br>Projects: %{x}<extra></extra>"
+            hovertemplate="Risk Level: %{x}<br>Business Impact: %{y}<br>Count: %{marker.size}<extra></extra>"
         ))
-        
-        # Update layout for better appearance
-        fig.update_layout(
-            title=dict(
-                text="Project Pipeline Status",
-                x=0.5,
-                y=0.95,
-                xanchor='center',
-                yanchor='top',
-                font=dict(size=20)
-            ),
-            xaxis=dict(
-                title="Number of Projects",
-                showgrid=True,
-                gridcolor='rgba(211,211,211,0.3)',
-                zeroline=False
-            ),
-            yaxis=dict(
-                title="",
-                showgrid=False,
-                zeroline=False
-            ),
-            plot_bgcolor='white',
-            showlegend=False,
-            height=400,
-            margin=dict(l=20, r=20, t=60, b=20),
-            bargap=0.3
-        )
-        
-        # Add percentage annotations
-        total_projects = phase_counts.sum()
-        if total_projects > 0:
-            percentages = (phase_counts / total_projects * 100).round(1)
-            for i, (count, percentage) in enumerate(zip(phase_counts, percentages)):
-                if count > 0:
-                    fig.add_annotation(
-                        x=count,
-                        y=PHASE_ORDER[i],
-                        text=f"{percentage}%",
-                        showarrow=False,
-                        xanchor='left',
-                        xshift=10,
-                        font=dict(size=12)
-                    )
-        
-        st.plotly_chart(fig, use_container_width=True)
-
-        # Add phase transition metrics
-        st.caption("Pipeline Health")
-        metric_cols = st.columns(4)
-        with metric_cols[0]:
-            planning_ratio = len(df[df['project_phase'] == 'Planning']) / len(df) * 100 if len(df) > 0 else 0
-            st.metric("Planning", f"{planning_ratio:.1f}%", 
-                     help="Percentage of projects in planning phase")
-        with metric_cols[1]:
-            progress_ratio = len(df[df['project_phase'] == 'In Progress']) / len(df) * 100 if len(df) > 0 else 0
-            st.metric("In Progress", f"{progress_ratio:.1f}%",
-                     help="Percentage of projects in progress")
-        with metric_cols[2]:
-            hold_ratio = len(df[df['project_phase'] == 'On Hold']) / len(df) * 100 if len(df) > 0 else 0
-            st.metric("On Hold", f"{hold_ratio:.1f}%",
-                     help="Percentage of projects on hold")
-        with metric_cols[3]:
-            completion_ratio = len(df[df['project_phase'] == 'Completed']) / len(df) * 100 if len(df) > 0 else 0
-            st.metric("Completed", f"{completion_ratio:.1f}%",
-                     help="Percentage of completed projects")
-
-    with right_col:
-        # Risk vs Impact Matrix
-        st.subheader("Risk vs Impact Matrix")
-        risk_impact_df = df.groupby(['risk_level', 'business_impact']).size().reset_index(name='count')
-        fig = px.scatter(
-            risk_impact_df,
-            x='risk_level',
-            y='business_impact',
-            size='count',
-            color='count',
+        risk_impact_fig.update_layout(
             title='Risk vs Business Impact',
-            labels={'risk_level': 'Risk Level', 'business_impact': 'Business Impact'}
+            xaxis_title='Risk Level',
+            yaxis_title='Business Impact'
         )
-        st.plotly_chart(fig, use_container_width=True)
-
-        # Resource Type Distribution
-        resource_df = pd.DataFrame({
-            'type': list(RESOURCE_TYPE_MAP.values()),
-            'count': [len(df[df['resource_type'] == i]) for i in RESOURCE_TYPE_MAP.keys()]
-        })
-        fig = px.pie(
-            resource_df,
-            values='count',
-            names='type',
-            title='Resource Distribution'
-        )
-        st.plotly_chart(fig, use_container_width=True)
 
-def render_projects_tab(df):
+    # Resource Type Distribution, built straight from the three counts
+    resource_fig = go.Figure(go.Pie(
+        labels=resource_counts.index.tolist(),
+        values=resource_counts.tolist(),
+        hole=0.4
+    ))
+    resource_fig.update_layout(title='Resource Distribution')
+
+    return {
+        'metrics': [
+            ("Total Projects", total),
+            ("High Priority Projects", summary['high_priority']),
+            ("Active Projects", phase_counts['In Progress']),
+            ("Categories", summary['categories']),
+        ],
+        'phase_ratios': (phase_counts / total * 100).round(1),
+        'treemap': build_treemap(version),
+        'treemap_caption': build_treemap_caption(summary['categories'], len(load_treemap_data(version))),
+        'pipeline': pipeline_fig,
+        'risk_impact': risk_impact_fig,
+        'resource': resource_fig,
+    }
+
+def render_dashboard_tab(summary, version):
+    dashboard = build_dashboard(summary, version)
+
+    # Render everything in one pass
+    with st.container():
+        # Top level metrics
+        for col, (label, value) in zip(st.columns(4), dashboard['metrics']):
+            col.metric(label, value)
+
+        # Two columns layout
+        left_col, right_col = st.columns([2, 1])
+
+        with left_col:
+            # Project Distribution by Category and Priority
+            st.subheader("Project Distribution")
+            if dashboard['treemap'] is not None:
+                st.plotly_chart(dashboard['treemap'], use_container_width=True)
+                if dashboard['treemap_caption']:
+                    st.caption(dashboard['treemap_caption'])
+
+            st.subheader("Project Pipeline")
+            st.plotly_chart(dashboard['pipeline'], use_container_width=True)
+
+            # Add phase transition metrics
+            st.caption("Pipeline Health")
+            for col, phase in zip(st.columns(4), PHASE_ORDER):
+                col.metric(phase, f"{dashboard['phase_ratios'][phase]:.1f}%", help=PHASE_HELP[phase])
+
+        with right_col:
+            st.subheader("Risk vs Impact Matrix")
+            if dashboard['risk_impact'] is not None:
+                st.plotly_chart(dashboard['risk_impact'], use_container_width=True)
+            st.plotly_chart(dashboard['resource'], use_container_width=True)
+
+# Runs as a fragment, so filter changes rerun only this tab instead of rebuilding
+# every dashboard chart; filter options are cached per data version
+@st.fragment
+def render_projects_tab():
+    version = get_data_version()
+    categories = load_categories(version)
+
     # Project Details Table
     st.subheader("Project Details")
     
@@ -200,7 +476,7 @@ def render_projects_tab(df):
     with col1:
         category_filter = st.multiselect(
             "Filter by Category",
-            options=sorted(df['category'].unique())
+            options=categories
         )
     with col2:
         phase_filter = st.multiselect(
@@ -215,20 +491,23 @@ def render_projects_tab(df):
             value=1
         )
 
-    # Apply filters
-    filtered_df = df.copy()
-    if category_filter:
-        filtered_df = filtered_df[filtered_df['category'].isin(category_filter)]
-    if phase_filter:
-        filtered_df = filtered_df[filtered_df['project_phase'].isin(phase_filter)]
-    filtered_df = filtered_df[filtered_df['priority_level'] >= priority_filter]
+    # Apply filters in SQL and fetch only the current page
+    filters = (tuple(category_filter), tuple(phase_filter), priority_filter)
+    total_rows = count_projects(version, *filters)
+    page_count = max(1, math.ceil(total_rows / PROJECTS_PAGE_SIZE))
+    # Start from the first page whenever the filters change, and keep the
+    # selected page in range if the data shrinks underneath it
+    if st.session_state.get('projects_filters') != filters:
+        st.session_state['projects_filters'] = filters
+        st.session_state['projects_page'] = 1
+    elif st.session_state.get('projects_page', 1) > page_count:
+        st.session_state['projects_page'] = page_count
+    page = st.number_input("Page", min_value=1, max_value=page_count, step=1, key='projects_page')
+    filtered_df = load_projects(version, *filters, page)
 
     # Display filtered table with enhanced styling
     st.dataframe(
-        filtered_df[[
-            'project_name', 'category', 'priority_level', 'project_phase',
-            'business_impact', 'risk_level', 'notes'
-        ]],
+        filtered_df,
         hide_index=True,
         use_container_width=True,
         column_config={
@@ -241,14 +520,16 @@ def render_projects_tab(df):
             'notes': 'Notes'
         }
     )
+    st.caption(f"Page {page} of {page_count} ({total_rows} projects)")
 
 def main():
     st.title("🚀 Project Portfolio Dashboard")
     
-    # Load data
-    df = load_data()
+    # Load aggregated metrics
+    version = get_data_version()
+    summary = load_summary(version)
     
-    if df.empty:
+    if not summary or not summary['total']:
         st.warning("No data available. Please check your database connection.")
         return
 
@@ -256,10 +537,10 @@ def main():
     tab1, tab2 = st.tabs(["📊 Dashboard", "📋 Project Details"])
     
     with tab1:
-        render_dashboard_tab(df)
+        render_dashboard_tab(summary, version)
         
     with tab2:
-        render_projects_tab(df)
+        render_projects_tab()
     
     # Add refresh button at the bottom
     st.divider()  # Add a visual separator
@@ -269,7 +550,7 @@ def main():
             st.cache_data.clear()
             st.cache_resource.clear()
             st.rerun()
-        st.caption("Data automatically refreshes every 60 seconds", help="The dashboard will update with any new data every minute")
+        st.caption("Data is reloaded on the next interaction after the database changes", help="Cached results are reused until projects are added, removed or updated")
 
 if __name__ == "__main__":
     main() 